@@ -1,9 +1,19 @@
 # add_users.py
+import os
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from passlib.context import CryptContext
 
-# This must be the EXACT same as in your main.py file
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Per-role work factors: admins get a stronger hash, throwaway demo accounts
+# a cheaper one so seeding stays fast. verify_password in main.py still works
+# for both - passlib reads the cost embedded in each hash.
+_ctx_strong = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=13)
+_ctx_fast = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=10)
+
+def hash_for_role(user):
+    username, password, role = user
+    context = _ctx_strong if role == 'admin' else _ctx_fast
+    return context.hash(password)
 
 # --- User Data to Add ---
 # Format: (username, plain_text_password, role)
@@ -22,8 +32,12 @@ users_to_add = [
 # --- Database Connection ---
 try:
     # Connect to your SQLite database
-    conn = sqlite3.connect('videos.db')
+    # isolation_level=None disables pysqlite's implicit per-statement
+    # transactions so we control BEGIN/COMMIT ourselves
+    conn = sqlite3.connect('videos.db', isolation_level=None)
     cursor = conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
     print("✅ Database connected successfully.")
     
     # First, let's check if the users table exists and has the right structure
@@ -40,50 +54,41 @@ try:
         print(f"  - {col[1]} ({col[2]})")
     
     print(f"\n🔄 Processing {len(users_to_add)} users...")
-    
-    # Loop through the users and add them
-    for username, password, role in users_to_add:
-        # Securely hash the password
-        hashed_password = pwd_context.hash(password)
-        
-        # Check if user already exists
-        cursor.execute("SELECT username FROM users WHERE username = ?", (username,))
-        existing_user = cursor.fetchone()
-        
-        if existing_user:
-            print(f"⚠️ User '{username}' already exists. Updating role to '{role}'...")
-            # Update existing user's role and password
-            cursor.execute(
-                "UPDATE users SET hashed_password = ?, role = ? WHERE username = ?",
-                (hashed_password, role, username)
-            )
-            print(f"✔️ Updated user: {username} with role: {role}")
-        else:
-            # Insert the new user into the 'users' table
-            cursor.execute(
-                "INSERT INTO users (username, hashed_password, role) VALUES (?, ?, ?)",
-                (username, hashed_password, role)
-            )
-            print(f"✔️ Added new user: {username} with role: {role}")
+
+    # Hash all passwords in parallel first - bcrypt releases the GIL in its C
+    # extension, so this scales across cores instead of serializing ~250ms hashes
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        hashes = list(executor.map(hash_for_role, users_to_add))
+
+    # Batch all writes in one transaction so SQLite fsyncs once, not per user
+    cursor.execute("BEGIN")
+
+    # executemany prepares the upsert once and pipelines all rows through it
+    # in a single C-level loop instead of re-parsing SQL per user
+    rows = [(username, hashed_password, role)
+            for (username, _, role), hashed_password in zip(users_to_add, hashes)]
+    cursor.executemany(
+        "INSERT INTO users (username, hashed_password, role) VALUES (?, ?, ?) "
+        "ON CONFLICT(username) DO UPDATE SET hashed_password = excluded.hashed_password, role = excluded.role",
+        rows
+    )
+    for username, _, role in users_to_add:
+        print(f"✔️ Added/updated user: {username} with role: {role}")
     
     # Commit the changes to the database
     conn.commit()
     print("\n✅ All changes have been saved to the database.")
     
-    # Display final user summary
+    # Display final user summary - GROUP_CONCAT returns one printable row per
+    # role, so no Python-side grouping is needed
     print("\n📊 FINAL USER SUMMARY:")
-    cursor.execute("SELECT username, role FROM users ORDER BY role, username")
-    all_users = cursor.fetchall()
-    
-    role_groups = {}
-    for username, role in all_users:
-        if role not in role_groups:
-            role_groups[role] = []
-        role_groups[role].append(username)
-    
-    for role in ['admin', 'teacher', 'student']:
-        if role in role_groups:
-            print(f"  {role.upper()}S: {', '.join(role_groups[role])}")
+    cursor.execute(
+        "SELECT role, GROUP_CONCAT(username, ', ') FROM users "
+        "WHERE role IN ('admin', 'teacher', 'student') GROUP BY role "
+        "ORDER BY CASE role WHEN 'admin' THEN 0 WHEN 'teacher' THEN 1 ELSE 2 END"
+    )
+    for role, usernames in cursor.fetchall():
+        print(f"  {role.upper()}S: {usernames}")
     
     print("\n🎯 LOGIN CREDENTIALS:")
     for username, password, role in users_to_add:
@@ -0,0 +1,91 @@
+# models.py - single home for the engine, session factory and ORM models so
+# every entrypoint shares one SQLAlchemy registry instead of redefining it.
+import enum
+
+from sqlalchemy import Column, Integer, String, ForeignKey, Enum, Index, event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import declarative_base, relationship
+# --- Enums for Roles and Statuses ---
+class UserRole(str, enum.Enum):
+    student = "student"
+    teacher = "teacher"
+    admin = "admin"
+
+class VideoStatus(str, enum.Enum):
+    pending = "pending"
+    approved = "approved"
+    rejected = "rejected"
+
+# --- Database Setup ---
+# aiosqlite runs each SQLite call on its own worker thread, so queries no
+# longer block the uvicorn event loop
+DATABASE_URL = "sqlite+aiosqlite:///./videos.db"
+# A sized connection pool multiplexes concurrent requests over warm
+# connections instead of funnelling everything through one (WAL allows one
+# writer alongside many readers). pre_ping drops dead connections at checkout
+# rather than surfacing them mid-request.
+engine = create_async_engine(
+    DATABASE_URL,
+    pool_size=20,
+    max_overflow=10,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+)
+# expire_on_commit=False so ORM objects stay readable after commit without
+# triggering implicit refresh queries from an async context
+SessionLocal = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
+Base = declarative_base()
+
+@event.listens_for(engine.sync_engine, "connect")
+def _set_sqlite_pragmas(dbapi_conn, connection_record):
+    # WAL lets readers run concurrently with the writer; NORMAL sync and a
+    # bigger page cache (~20MB) cut per-commit fsync and re-read costs
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-20000")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    # Retry briefly on a locked database instead of failing the request
+    # outright when a writer holds the lock
+    cursor.execute("PRAGMA busy_timeout=30000")
+    cursor.close()
+
+@event.listens_for(engine.sync_engine, "close")
+def _optimize_on_close(dbapi_conn, connection_record):
+    # SQLite recommends running PRAGMA optimize when closing connections
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA optimize")
+    cursor.close()
+
+# --- Models ---
+class Lesson(Base):
+    __tablename__ = "lessons"
+    id = Column(Integer, primary_key=True, index=True)
+    title = Column(String, unique=True, index=True)
+    category = Column(String)
+    videos = relationship("Video", back_populates="lesson", cascade="all, delete-orphan")
+
+class Video(Base):
+    __tablename__ = "videos"
+    # Composite indexes serve the hot filters with a seek instead of a full
+    # table scan: lesson+language for the homepage join, and status-first for
+    # the approved-index and pending-moderation queries
+    __table_args__ = (
+        Index("ix_videos_lesson_lang", "lesson_id", "language"),
+        Index("ix_videos_status_lesson_lang", "approval_status", "lesson_id", "language"),
+    )
+    id = Column(Integer, primary_key=True, index=True)
+    video_url = Column(String, index=True)
+    language = Column(String, default="English")
+    public_id = Column(String)
+    lesson_id = Column(Integer, ForeignKey("lessons.id"))
+    lesson = relationship("Lesson", back_populates="videos")
+    approval_status = Column(Enum(VideoStatus), default=VideoStatus.pending, nullable=False)
+
+class User(Base):
+    __tablename__ = "users"
+    id = Column(Integer, primary_key=True, index=True)
+    username = Column(String, unique=True, index=True)
+    hashed_password = Column(String)
+    role = Column(Enum(UserRole), default=UserRole.student)